@@ -0,0 +1,28 @@
+""" Shared fixtures for the tests of the package. """
+
+import os
+from pathlib import Path
+import sys
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def utils_dir(monkeypatch: pytest.MonkeyPatch) -> Path:
+    """ Runs each test from the package directory, as the modules resolve
+    their data and stub files relative to the working directory. """
+
+    monkeypatch.chdir(_ROOT / 'utils')
+    return _ROOT / 'utils'
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """ The application instance the widgets need, without a display. """
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,145 @@
+""" Tests for the colour module. """
+
+import copy
+import importlib
+import pickle
+from types import ModuleType
+
+import pytest
+
+pytest.importorskip('PySide6')
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent, QPaintEvent
+from PySide6.QtWidgets import QStyle, QStyleFactory, QWidget
+import shiboken6
+
+
+@pytest.fixture
+def colours(utils_dir) -> ModuleType:
+    """ The colour module, imported from the package directory. """
+
+    return importlib.import_module('utils.colours')
+
+
+@pytest.mark.parametrize('duplicate', [
+    copy.copy, copy.deepcopy, lambda c: pickle.loads(pickle.dumps(c))])
+def test_colour_copies(colours, duplicate):
+    colour = colours.Colour('test', 1, 2, 3)
+    new = duplicate(colour)
+    assert type(new) is colours.Colour
+    assert repr(new) == repr(colour)
+    assert (new.as_rgb, new.as_hex) == (colour.as_rgb, colour.as_hex)
+    assert new == colour and hash(new) == hash(colour)
+
+
+def test_colour_is_read_only(colours):
+    colour = colours.Colour('test', 1, 2, 3)
+    with pytest.raises(AttributeError):
+        colour.r = 4
+    with pytest.raises(AttributeError):
+        del colour.name
+
+
+def test_colour_representations(colours):
+    colour = colours.Colour('test', 1, 20, 255)
+    assert colour.as_rgb == '[001, 020, 255]'
+    assert colour.as_hex == '#0114FF'
+    assert list(colour) == [1, 20, 255]
+
+
+def test_as_qt_returns_independent_copies(colours):
+    colour = colours.Colour('test', 1, 2, 3)
+    first = colour.as_qt()
+    assert first == colours.QColor(1, 2, 3)
+    assert first is not colour.as_qt()
+    first.setRgb(9, 9, 9)
+    assert colour.as_qt() == colours.QColor(1, 2, 3)
+    assert colour.as_qt(negative=True) == colours.QColor(254, 253, 252)
+
+
+@pytest.mark.parametrize('index', [-1, 10_000])
+def test_colour_at_rejects_out_of_range_indices(colours, index):
+    with pytest.raises(KeyError):
+        colours.Colours.colour_at(index)
+    with pytest.raises(KeyError):
+        colours.Colours[index]
+
+
+def test_index_and_colour_at_agree(colours):
+    palette = colours.Colours
+    for idx, colour in enumerate(palette):
+        assert palette.index(colour.name) == idx
+        assert palette.colour_at(idx) is colour
+        assert palette[colour.name] == (colour, idx)
+
+
+def test_drawer_selects_colours_and_ignores_empty_cells(colours, qapp):
+    palette = colours.Colours
+    drawer = colours._ColourBoxDrawer(palette.white)
+    selected = []
+    drawer.colourSelected.connect(selected.append)
+
+    def click_and_paint(row: int, column: int) -> None:
+        position = QPointF(column * 20 + 5, row * 20 + 5)
+        drawer.mousePressEvent(QMouseEvent(
+            QEvent.Type.MouseButtonPress, position, position,
+            Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier))
+        drawer.paintEvent(QPaintEvent(drawer.rect()))
+
+    click_and_paint(1, 2)
+    assert selected == [27] and drawer.selection is palette.colour_at(27)
+    last = len(list(palette)) - 1
+    click_and_paint(*divmod(last, 25))
+    assert selected == [27, last]
+    # The first cell without a colour and the last (empty) row of the grid
+    click_and_paint(*divmod(last + 1, 25))
+    click_and_paint(449 // 20, 0)
+    assert selected == [27, last]
+    assert drawer.selection is palette.colour_at(last)
+
+
+def test_standard_icons_are_cached_per_style(colours, qapp):
+    sp = QStyle.StandardPixmap.SP_DialogApplyButton
+    first, second = QWidget(), QWidget()
+    styles = [QStyleFactory.create('Fusion') for _ in range(2)]  # Same name
+    first.setStyle(styles[0])
+    second.setStyle(styles[1])
+    icon = colours._standard_icon(first, sp)
+    assert colours._standard_icon(first, sp) is icon
+    assert colours._standard_icon(second, sp) is not icon
+
+    key = shiboken6.getCppPointer(styles[1])[0]
+    assert key in colours._STANDARD_ICONS
+    shiboken6.delete(second)
+    shiboken6.delete(styles[1])
+    assert key not in colours._STANDARD_ICONS
+    assert colours._standard_icon(first, sp) is icon
+
+
+def test_colour_equality(colours):
+    colour = colours.Colour('test', 1, 2, 3)
+    assert colour == colours.Colour('other', 1, 2, 3)
+    assert colour != colours.Colour('test', 1, 2, 4)
+    assert colour == (1, 2, 3) and colour == [1, 2, 3, 4]
+    assert colour == iter((1, 2, 3))
+    assert colour == colours.QColor(1, 2, 3)
+    assert colour != 5 and colour != None  # noqa: E711
+
+
+def test_colour_hash(colours):
+    colour = colours.Colour('test', 1, 2, 3)
+    assert hash(colour) == hash(('test', 1, 2, 3))
+    assert hash(colour) != hash(colours.Colour('other', 1, 2, 3))
+    assert len({colour, colours.Colour('test', 1, 2, 3)}) == 1
+
+
+def test_colours_is_created_lazily_and_exported(colours):
+    namespace = {}
+    exec('from utils.colours import *', namespace)
+    assert namespace['Colours'] is colours._Colours()
+    assert namespace['Colours'].red == colours.Colours.red
+    assert all(hasattr(colours, name) for name in colours.__all__)
+    with pytest.raises(AttributeError):
+        colours.no_such_attribute
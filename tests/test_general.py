@@ -0,0 +1,134 @@
+""" Tests for the general utilities. """
+
+import copy
+import importlib
+import pickle
+import shutil
+
+import pytest
+
+pytest.importorskip('PySide6')
+
+from utils._general import BijectiveDict
+
+_STUB_MODULES = ['colours', 'custom_file_dialog', 'message', 'theme',
+                 'theme_creator']
+
+
+@pytest.fixture
+def bd() -> BijectiveDict:
+    """ A dictionary with two pairs. """
+
+    d = BijectiveDict(int)
+    d[1] = 'a'
+    d[2] = 'b'
+    return d
+
+
+def assert_pairs(d: BijectiveDict, pairs: dict) -> None:
+    """ Checks that both directions and the key stores match the pairs. """
+
+    assert d.keys() == list(pairs)
+    assert d.values() == list(pairs.values())
+    assert d.items() == list(pairs.items())
+    assert list(d) == list(pairs)
+    assert len(d) == len(pairs)
+    assert dict.__len__(d) == 2 * len(pairs)
+    for key, value in pairs.items():
+        assert d[key] == value and d[value] == key
+        assert key in d and value in d
+
+
+def test_views_agree_with_len(bd):
+    assert len(bd.keys()) == len(bd.values()) == len(bd.items()) == len(bd)
+    assert bd.items() == [(1, 'a'), (2, 'b')]
+    assert bd.values(secondary_only=False) == ([1, 2], ['a', 'b'])
+    assert dict(bd) == {1: 'a', 2: 'b'}
+
+
+def test_setitem_replaces_both_directions(bd):
+    bd[1] = 'b'
+    assert_pairs(bd, {1: 'b'})
+    assert 'a' not in bd and 2 not in bd
+
+
+def test_delitem(bd):
+    del bd['a']
+    assert_pairs(bd, {2: 'b'})
+
+
+def test_update(bd):
+    bd.update({3: 'c'}, x=4)
+    assert_pairs(bd, {1: 'a', 2: 'b', 3: 'c', 4: 'x'})
+    assert bd.get('c') == 3
+
+
+def test_ior_and_or(bd):
+    merged = bd | {3: 'c'}
+    assert isinstance(merged, BijectiveDict)
+    assert_pairs(merged, {1: 'a', 2: 'b', 3: 'c'})
+    assert_pairs(bd, {1: 'a', 2: 'b'})
+    bd |= [(3, 'c')]
+    assert_pairs(bd, {1: 'a', 2: 'b', 3: 'c'})
+
+
+def test_pop(bd):
+    assert bd.pop(1) == 'a'
+    assert_pairs(bd, {2: 'b'})
+    assert bd.pop('b') == 2
+    assert_pairs(bd, {})
+    assert bd.pop(1, None) is None
+    with pytest.raises(KeyError):
+        bd.pop(1)
+
+
+def test_popitem(bd):
+    assert bd.popitem() == (2, 'b')
+    assert_pairs(bd, {1: 'a'})
+    bd.popitem()
+    with pytest.raises(KeyError):
+        bd.popitem()
+
+
+def test_setdefault(bd):
+    assert bd.setdefault(1, 'z') == 'a'
+    assert bd.setdefault(3, 'c') == 'c'
+    assert_pairs(bd, {1: 'a', 2: 'b', 3: 'c'})
+
+
+def test_clear(bd):
+    bd.clear()
+    assert_pairs(bd, {})
+    bd[3] = 'c'
+    assert_pairs(bd, {3: 'c'})
+
+
+@pytest.mark.parametrize('duplicate', [
+    BijectiveDict.copy, copy.copy, copy.deepcopy,
+    lambda d: pickle.loads(pickle.dumps(d))])
+def test_copies_are_independent(bd, duplicate):
+    new = duplicate(bd)
+    assert type(new) is BijectiveDict
+    assert_pairs(new, {1: 'a', 2: 'b'})
+    new[3] = 'c'
+    del new[1]
+    assert_pairs(bd, {1: 'a', 2: 'b'})
+
+
+@pytest.mark.parametrize('name', _STUB_MODULES)
+def test_generated_stubs_match_the_shipped_ones(name, utils_dir, tmp_path,
+                                                monkeypatch):
+    # The modules only (re)generate their stubs if the file is missing
+    work_dir = tmp_path / 'utils'
+    shutil.copytree(utils_dir, work_dir,
+                    ignore=shutil.ignore_patterns('*.pyi', '__pycache__'))
+    monkeypatch.chdir(work_dir)
+    importlib.import_module(f"utils.{name}")._init_module()
+
+    generated = (work_dir / f"{name}.pyi").read_text().splitlines()
+    shipped = (utils_dir / f"{name}.pyi").read_text().splitlines()
+    if name == 'theme':  # The themes are listed in directory order
+        generated.sort()
+        shipped.sort()
+
+    assert generated == shipped
@@ -4,23 +4,37 @@ __author__ = "Mihaly Konda"
 __version__ = '1.1.1'
 
 # Built-in modules
-from collections import UserDict
+from collections.abc import Iterator
 from dataclasses import is_dataclass
-from functools import cached_property
+from enum import Enum
+from functools import cache, cached_property
 import inspect
+from operator import attrgetter
 import os
 import sys
+import threading
 from types import FunctionType, MethodType, TracebackType
-from typing import Any, Generic, Never, Type, TypeVar
+from typing import Any, Generic, Never, Self, Type, TypeVar
 
 # Qt6 modules
 from PySide6.QtCore import Signal
 
 
-class BijectiveDict(UserDict):
+_MISSING = object()  # Sentinel for absent keys/annotations
+
+# Unbound dict methods for bypassing the overrides in BijectiveDict
+_dict_set = dict.__setitem__
+_dict_del = dict.__delitem__
+_dict_len = dict.__len__
+_dict_pop = dict.pop
+
+
+class BijectiveDict(dict):
     """ A custom dictionary providing bijective mapping between a main type
     and a hashable secondary type. """
 
+    __slots__ = ('_primary_type', '_mains', '_secondaries')
+
     def __init__(self, primary_type: type) -> None:
         """ Initializer for the class.
 
@@ -28,19 +42,9 @@ class BijectiveDict(UserDict):
         """
 
         super().__init__()
-        self._internal_dict = {}
         self._primary_type = primary_type
-
-    def __getitem__(self, item: Any) -> Any:
-        """ Returns a value from the internal dictionary accessed with '[]'
-        (either of the main or the secondary type).
-
-        :param item: The key whose associated value is to be returned.
-
-        :returns: The (primary/secondary type) value associated with the key.
-        """
-
-        return self._internal_dict[item]
+        self._mains = {}  # Insertion-ordered sets of the keys of either type
+        self._secondaries = {}
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """ Sets/updates a key-value pair in a bijective way.
@@ -49,14 +53,16 @@ class BijectiveDict(UserDict):
         :param value: Usually the object of secondary type.
         """
 
-        if key in self._internal_dict:
-            dict.__delitem__(self._internal_dict, key)
+        if self.get(key, _MISSING) is value \
+                and self.get(value, _MISSING) is key:
+            return  # The pair is already mapped
 
-        if value in self._internal_dict:
-            dict.__delitem__(self._internal_dict, value)
-
-        dict.__setitem__(self._internal_dict, key, value)
-        dict.__setitem__(self._internal_dict, value, key)
+        self._evict(key)
+        self._evict(value)
+        _dict_set(self, key, value)
+        _dict_set(self, value, key)
+        self._side(key)[key] = None
+        self._side(value)[value] = None
 
     def __delitem__(self, item: Any) -> None:
         """ Deletes a key-value pair in a bijective way.
@@ -64,21 +70,152 @@ class BijectiveDict(UserDict):
         :param item: Usually the object of primary type.
         """
 
-        dict.__delitem__(self._internal_dict, self[item])
-        dict.__delitem__(self._internal_dict, item)
+        pair = self[item]
+        _dict_del(self, pair)
+        _dict_del(self, item)
+        self._side(pair).pop(pair, None)
+        self._side(item).pop(item, None)
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterates over the keys of the primary type. """
+
+        return iter(self._mains)
+
+    def __ior__(self, other: Any) -> Self:
+        """ Updates the dictionary in place with the '|=' operator.
+
+        :param other: A mapping or an iterable of key-value pairs.
+        """
+
+        self.update(other)
+        return self
+
+    def __or__(self, other: Any) -> Self:
+        """ Returns a merged copy with the '|' operator.
+
+        :param other: A mapping or an iterable of key-value pairs.
+        """
+
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __reduce__(self) -> tuple:
+        """ Supports copying and pickling: the pairs are restored through
+        __setitem__, keeping the key stores consistent. """
+
+        return (self.__class__, (self._primary_type,), None, None,
+                iter(dict.items(self)))
 
     def __len__(self) -> int:
-        """ Returns the adjusted size of the internal dictionary. """
+        """ Returns the adjusted size of the dictionary (number of pairs). """
+
+        return _dict_len(self) // 2
+
+    def clear(self) -> None:
+        """ Removes all pairs from the dictionary. """
+
+        dict.clear(self)
+        self._mains.clear()
+        self._secondaries.clear()
+
+    def copy(self) -> Self:
+        """ Returns a shallow copy of the dictionary. """
+
+        new = self.__class__(self._primary_type)
+        dict.update(new, dict.items(self))
+        new._mains.update(self._mains)
+        new._secondaries.update(self._secondaries)
+        return new
+
+    def pop(self, item: Any, default: Any = _MISSING) -> Any:
+        """ Removes a pair and returns the value associated with the item.
+
+        :param item: The object (of either type) to remove.
+        :param default: The value to return if the item is not present.
+
+        :raises KeyError: The item is not present and no default is given.
+        """
+
+        if item in self:
+            pair = self[item]
+            del self[item]
+            return pair
+
+        if default is _MISSING:
+            raise KeyError(item)
+
+        return default
+
+    def popitem(self) -> tuple[Any, Any]:
+        """ Removes the last inserted pair and returns it as a
+        (primary, secondary) tuple.
+
+        :raises KeyError: The dictionary is empty.
+        """
+
+        if not self._mains:
+            raise KeyError('popitem(): dictionary is empty')
+
+        key = next(reversed(self._mains))
+        return key, self.pop(key)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """ Returns the value associated with the key, mapping the key to the
+        default first if it is not present.
+
+        :param key: Usually the object of primary type.
+        :param default: The value to map the key to if it is not present.
+        """
+
+        if key in self:
+            return self[key]
+
+        self[key] = default
+        return default
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:
+        """ Sets/updates the key-value pairs in a bijective way.
+
+        :param other: A mapping or an iterable of key-value pairs.
+        :param kwargs: Further key-value pairs.
+        """
+
+        for key, value in dict(other, **kwargs).items():
+            self[key] = value
+
+    def _evict(self, item: Any) -> None:
+        """ Removes an item and its pair if the item is present.
+
+        :param item: The object (of either type) to remove.
+        """
+
+        if (pair := _dict_pop(self, item, _MISSING)) is not _MISSING:
+            _dict_pop(self, pair, None)
+            self._side(item).pop(item, None)
+            self._side(pair).pop(pair, None)
+
+    def _side(self, item: Any) -> dict:
+        """ Returns the internal key store corresponding to the type of an item.
 
-        return dict.__len__(self._internal_dict) // 2
+        :param item: The item whose side of the mapping is to be determined.
 
-    def __repr__(self) -> str:
-        """ Returns the repr of the internal dictionary. """
+        :returns: The store of either the primary or the secondary keys.
+        """
+
+        if isinstance(item, self._primary_type):
+            return self._mains
+
+        return self._secondaries
+
+    def items(self) -> list[tuple[Any, Any]]:
+        """ Returns the pairs of the dictionary as (primary, secondary) tuples,
+        one per pair. """
 
-        return dict.__repr__(self._internal_dict)
+        return [(key, self[key]) for key in self._mains]
 
     def keys(self, primary_only: bool = True) -> list | tuple[list, list]:
-        """ Returns the keys of the internal dictionary.
+        """ Returns the keys of the dictionary.
 
         :param primary_only: A flag to only return the keys of the primary type
             (default behaviour).
@@ -87,19 +224,13 @@ class BijectiveDict(UserDict):
             a list of keys of the secondary type.
         """
 
-        mains = [k for k in self._internal_dict.keys()
-                 if isinstance(k, self._primary_type)]
-
         if primary_only:
-            return mains
-
-        secondaries = [k for k in self._internal_dict.keys()
-                       if not isinstance(k, self._primary_type)]
+            return list(self._mains)
 
-        return mains, secondaries
+        return list(self._mains), list(self._secondaries)
 
     def values(self, secondary_only: bool = True) -> list | tuple[list, list]:
-        """ Returns the values of the internal dictionary.
+        """ Returns the values of the dictionary.
 
         :param secondary_only: A flag to only return the keys of the secondary
             type (default behaviour).
@@ -109,21 +240,18 @@ class BijectiveDict(UserDict):
             primary type.
         """
 
-        secondaries = [k for k in self._internal_dict.keys()
-                       if not isinstance(k, self._primary_type)]
-
+        values = [self[key] for key in self._mains]  # In the order of keys()
         if secondary_only:
-            return secondaries
+            return values
 
-        mains = [k for k in self._internal_dict.keys()
-                 if isinstance(k, self._primary_type)]
-
-        return mains, secondaries
+        return list(self._mains), values
 
 
 class ReadOnlyDescriptor:
     """ Read-only descriptor for use with protected storage attributes. """
 
+    __slots__ = ('_storage_name', '_getter')
+
     def __set_name__(self, owner: type, name: str) -> None:
         """ Sets the name of the storage attribute.
 
@@ -131,7 +259,9 @@ class ReadOnlyDescriptor:
         :param name: The managed attribute's name.
         """
 
-        self._storage_name = f"_{name}"
+        # Interned to match the (interned) attribute names of the instances
+        self._storage_name = sys.intern(f"_{name}")
+        self._getter = attrgetter(self._storage_name)
 
     def __get__(self, instance: Any, instance_type: type = None) -> Any:
         """ Returns the value of the protected storage attribute.
@@ -146,7 +276,7 @@ class ReadOnlyDescriptor:
         if instance is None:
             return self  # Class accession: return the descriptor itself
 
-        return getattr(instance, self._storage_name)
+        return self._getter(instance)
 
     def __set__(self, instance: Any, value: Any) -> Never:
         """ Sets the value of the protected storage attribute (would, but
@@ -170,6 +300,8 @@ _T = TypeVar('_T')
 class SignalBlocker(Generic[_T]):
     """ Temporarily blocks the signals of the handled QObject. """
 
+    __slots__ = ('_obj',)
+
     def __init__(self, obj: _T) -> None:
         """ Initializer for the class.
 
@@ -198,19 +330,32 @@ class SignalBlocker(Generic[_T]):
 class Singleton(type):
     """ A metaclass making instance classes singletons. """
 
-    _instances = {}  # Shared between instance classes, hence the dict
+    # Reentrant, as an instance class might create another one on init
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs) -> Any:
         """ Returns the existing instance or creates a new one. """
 
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # The instance is stored in the namespace of its own class, so that
+        # subclasses of an instance class get their own instance
+        if (instance := cls.__dict__.get('_singleton_instance')) is not None:
+            return instance
+
+        with cls._lock:
+            if (instance := cls.__dict__.get('_singleton_instance')) is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._singleton_instance = instance
 
+        return instance
 
+
+@cache
 def resource_path(relative_path: str) -> str:
     """ Get absolute path to resource (for apps built with PyInstaller).
 
+    .. note:: The results are cached, so the working directory should not
+        be changed after the first call outside a bundled app.
+
     :param relative_path: A string representing a relative path to the
         requested resource.
 
@@ -222,6 +367,9 @@ def resource_path(relative_path: str) -> str:
                         relative_path)
 
 
+_stub_cache: dict[tuple, str] = {}  # (obj, signals, extra_cvs) -> stub repr
+
+
 def _stub_repr_function_like(f: cached_property | FunctionType | MethodType,
                              class_bound: bool) -> str:
     """ Creates a stub representation for a function-like object.
@@ -241,11 +389,13 @@ def _stub_repr_function_like(f: cached_property | FunctionType | MethodType,
     elif isinstance(f, MethodType):  # Cannot yet differentiate static methods
         decorator = '\t@classmethod\n'
 
-    anns = []
-    defaults = [] if f.__defaults__ is None else list(f.__defaults__)
+    annotations = f.__annotations__
+    defaults = f.__defaults__ or ()
+    defaults_left = len(defaults)
 
+    anns = []
     # Using reverse order to get the default values
-    for param, typ in list(f.__annotations__.items())[::-1]:
+    for param, typ in reversed(annotations.items()):
         if param == 'return':  # Return annotation is handled on its own
             continue
 
@@ -253,24 +403,27 @@ def _stub_repr_function_like(f: cached_property | FunctionType | MethodType,
         if not isinstance(typ, str) and typ is not None:
             typ = typ.__name__
 
-        default_value = ''
-        if defaults:
-            dv = defaults.pop()
-            if isinstance(dv, str):
-                default_value = f" = '{dv}'"
-            else:
-                default_value = f" = {dv}"
+        if not defaults_left:
+            anns.append(f"{param}: {typ}")
+            continue
 
-        anns.append(f"{param}: {typ}{default_value}")
+        defaults_left -= 1
+        dv = defaults[defaults_left]
+        if isinstance(dv, str):  # The repr of e.g. enums is not valid syntax
+            anns.append(f"{param}: {typ} = {dv!r}")
+        elif isinstance(dv, Enum):  # The str of an IntEnum is just the value
+            anns.append(f"{param}: {typ} = "
+                        f"{type(dv).__qualname__}.{dv.name}")
+        else:
+            anns.append(f"{param}: {typ} = {dv}")
 
     if isinstance(f, MethodType):  # Refers to a class method
         anns.append('cls')
     elif class_bound:
         anns.append('self')
 
-    try:
-        ret_type = f.__annotations__['return']
-    except KeyError:  # Return annotation is not provided in the function def
+    ret_type = annotations.get('return', _MISSING)
+    if ret_type is _MISSING:  # Return annotation is not provided in the def
         return_annotation = ''
     else:
         # The type is passed as a string if the source has __future__ annot.
@@ -278,11 +431,108 @@ def _stub_repr_function_like(f: cached_property | FunctionType | MethodType,
             ret_type = ret_type.__name__
         return_annotation = f" -> {ret_type}"
 
-    func_repr = f"{decorator}{'\t' if class_bound else ''}" \
-                f"def {f.__name__}({', '.join(anns[::-1])}" \
-                f"){return_annotation}: ...\n"
+    anns.reverse()
+    return ''.join((decorator, '\t' if class_bound else '', 'def ', f.__name__,
+                    '(', ', '.join(anns), ')', return_annotation, ': ...\n'))
+
+
+def _stub_function_like(name: str, attr: Any, signals: dict[str, str] | None,
+                        sections: dict[str, list[str]]) -> None:
+    """ Adds the stub representation of a function-like class attribute.
+
+    :param name: The name of the class attribute, unused here.
+    :param attr: The class attribute to represent.
+    :param signals: The signatures of the (Qt) signals of the class by their
+        names, unused here.
+    :param sections: The lists of representations of the class to extend.
+    """
+
+    sections['function_likes'].append(_stub_repr_function_like(attr, True))
+
+
+def _stub_read_only_descriptor(name: str, attr: Any,
+                               signals: dict[str, str] | None,
+                               sections: dict[str, list[str]]) -> None:
+    """ Adds the stub representation of a read-only descriptor.
+
+    :param name: The name of the class attribute.
+    :param attr: The class attribute to represent, unused here.
+    :param signals: The signatures of the (Qt) signals of the class by their
+        names, unused here.
+    :param sections: The lists of representations of the class to extend.
+    """
+
+    sections['class_vars'].append(f"\t{name}: ReadOnlyDescriptor = "
+                                  "ReadOnlyDescriptor()\n")
+
+
+def _stub_signal(name: str, attr: Any, signals: dict[str, str] | None,
+                 sections: dict[str, list[str]]) -> None:
+    """ Adds the stub representation of a requested (Qt) signal.
+
+    :param name: The name of the class attribute.
+    :param attr: The signal to represent, unused here.
+    :param signals: The signatures of the (Qt) signals of the class by their
+        names, as {sigName: sigName(carriedType1, ...)}.
+    :param sections: The lists of representations of the class to extend.
+    """
+
+    if signals is None or (sig := signals.get(name)) is None:
+        return
+
+    sections['signals'].append(f"\t{name} : ClassVar[Signal] = ...  # {sig}\n")
+
+
+def _stub_property(name: str, attr: Any, signals: dict[str, str] | None,
+                   sections: dict[str, list[str]]) -> None:
+    """ Adds the stub representation of the accessors of a property.
+
+    :param name: The name of the class attribute, unused here.
+    :param attr: The property to represent.
+    :param signals: The signatures of the (Qt) signals of the class by their
+        names, unused here.
+    :param sections: The lists of representations of the class to extend.
+    """
+
+    properties = sections['properties']
+    if (func := attr.fget) is not None:
+        properties.append(
+            f"\t@property\n{_stub_repr_function_like(func, True)}")
+
+    if (func := attr.fset) is not None:
+        properties.append(f"\t@{func.__name__}.setter\n"
+                          f"{_stub_repr_function_like(func, True)}")
 
-    return func_repr
+    if (func := attr.fdel) is not None:
+        properties.append(f"\t@{func.__name__}.deleter\n"
+                          f"{_stub_repr_function_like(func, True)}")
+
+
+_STUB_HANDLERS = {cached_property: _stub_function_like,
+                  FunctionType: _stub_function_like,
+                  MethodType: _stub_function_like,
+                  ReadOnlyDescriptor: _stub_read_only_descriptor,
+                  Signal: _stub_signal,
+                  property: _stub_property}
+_stub_handler_cache = dict(_STUB_HANDLERS)  # Also stores resolved subclasses
+
+
+def _stub_handler(typ: type) -> FunctionType | None:
+    """ Returns the stub representation handler of a type of class attribute.
+
+    :param typ: The type of the class attribute.
+
+    :returns: The handler corresponding to the type (or one of its bases), or
+        None if attributes of the type are not represented.
+    """
+
+    try:
+        return _stub_handler_cache[typ]
+    except KeyError:  # Not an exact match, look for a handled base class
+        handler = next((h for t, h in _STUB_HANDLERS.items()
+                        if issubclass(typ, t)), None)
+        _stub_handler_cache[typ] = handler
+        return handler
 
 
 def stub_repr(obj: object, signals: list[str] | None = None,
@@ -301,43 +551,38 @@ def stub_repr(obj: object, signals: list[str] | None = None,
     :returns: The stub representation of the input object.
     """
 
+    key = (obj, None if signals is None else tuple(signals), extra_cvs)
+    if (cached := _stub_cache.get(key)) is not None:
+        return cached
+
     repr_ = ''
     if inspect.isclass(obj):
-        function_likes = []
-        class_vars = []
-        signal_reprs = []
-        properties = []
-        for dir_item in dir(obj):
-            if not dir_item.startswith('__'):
-                cls_attr = getattr(obj, dir_item)
-                # print(f"{str(obj):<40}{str(cls_attr):<75}{type(cls_attr)}")
-                if any(isinstance(cls_attr, typ) for typ in
-                       [cached_property, FunctionType, MethodType]):
-                    function_likes.append(
-                        _stub_repr_function_like(cls_attr, True))
-                elif isinstance(cls_attr, ReadOnlyDescriptor):
-                    repr_ = f"\t{dir_item}: ReadOnlyDescriptor = " \
-                            "ReadOnlyDescriptor()\n"
-                    class_vars.append(repr_)
-                elif isinstance(cls_attr, Signal) and signals is not None:
-                    for sig in signals:
-                        if (sig_name := sig.split('(')[0]) in str(cls_attr):
-                            signal_reprs.append(f"\t{sig_name} : "
-                                                "ClassVar[Signal] = "
-                                                f"...  # {sig}\n")
-                elif isinstance(cls_attr, property):
-                    prop_funcs = {'fget': 'property',
-                                  'fset': '{fn}.setter',
-                                  'fdel': '{fn}.deleter'}
-
-                    for attr, deco in prop_funcs.items():
-                        if (func := getattr(cls_attr, attr)) is not None:
-                            if '{' in deco:
-                                deco = deco.format(fn=func.__name__)
-
-                            repr_ = f"\t@{deco}\n" \
-                                    f"{_stub_repr_function_like(func, True)}"
-                            properties.append(repr_)
+        signal_map = None
+        if signals is not None:
+            signal_map = {sig.partition('(')[0]: sig for sig in signals}
+
+        sections = {'function_likes': [], 'class_vars': [], 'signals': [],
+                    'properties': []}
+        # Merging the namespaces along the MRO instead of dir() + getattr()
+        attributes = {}
+        for cls in obj.__mro__:
+            for name, value in vars(cls).items():
+                if not name.startswith('__') and name not in attributes:
+                    attributes[name] = value
+
+        for dir_item in sorted(attributes):
+            cls_attr = attributes[dir_item]
+            if isinstance(cls_attr, classmethod | staticmethod):
+                cls_attr = getattr(obj, dir_item)  # Bound as in the class
+
+            # print(f"{str(obj):<40}{str(cls_attr):<75}{type(cls_attr)}")
+            if (handler := _stub_handler(type(cls_attr))) is not None:
+                handler(dir_item, cls_attr, signal_map, sections)
+
+        function_likes = sections['function_likes']
+        class_vars = sections['class_vars']
+        signal_reprs = sections['signals']
+        properties = sections['properties']
 
         bases = ''
         if obj.__bases__[0].__name__ != 'object':
@@ -351,14 +596,24 @@ def stub_repr(obj: object, signals: list[str] | None = None,
 
         class_decorator = '@dataclass\n' if is_dataclass(obj) else ''
 
-        repr_ = f"{class_decorator}class {obj.__name__}{bases}:\n" \
-                f"{''.join(signal_reprs) + '\n' if signal_reprs else ''}" \
-                f"{extra_cvs + '\n' if extra_cvs is not None else ''}" \
-                f"{''.join(class_vars) + '\n' if class_vars else ''}" \
-                f"{_stub_repr_function_like(obj.__init__, True)}" \
-                f"{''.join(function_likes)}" \
-                f"{''.join(properties)}"
+        parts = [class_decorator, 'class ', obj.__name__, bases, ':\n']
+        if signal_reprs:
+            parts.extend(signal_reprs)
+            parts.append('\n')
+
+        if extra_cvs is not None:
+            parts.extend((extra_cvs, '\n'))
+
+        if class_vars:
+            parts.extend(class_vars)
+            parts.append('\n')
+
+        parts.append(_stub_repr_function_like(obj.__init__, True))
+        parts.extend(function_likes)
+        parts.extend(properties)
+        repr_ = ''.join(parts)
     elif inspect.isfunction(obj):
         repr_ = _stub_repr_function_like(obj, False)
 
+    _stub_cache[key] = repr_
     return repr_
@@ -8,32 +8,48 @@ __version__ = '1.3.6'
 # Built-in modules
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from functools import cached_property
-from itertools import pairwise
+from functools import cache
+from itertools import islice, pairwise
 import json
 import os
 import sys
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Never, Optional
 
 # Qt6 modules
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
+from shiboken6 import getCppPointer
 
 # Custom modules/classes
-from utils._general import (BijectiveDict, ReadOnlyDescriptor, SignalBlocker,
-                            Singleton, stub_repr)
+from utils._general import BijectiveDict, SignalBlocker, Singleton, stub_repr
 try:
     from utils.theme import set_widget_theme, ThemeParameters, WidgetTheme
     _USE_THEME = True
 except ImportError:
     _USE_THEME = False
 
+try:
+    import orjson
+    _USE_ORJSON = True
+except ImportError:
+    _USE_ORJSON = False
+
+
+# Explicit, as 'Colours' is only created on first access (see __getattr__)
+__all__ = ['text_colour_threshold', 'set_text_colour_threshold',
+           'icon_file_path', 'set_icon_file_path', 'extended_default',
+           'set_extended_default', 'Colour', 'Colours', 'ColourSelector',
+           'ColourSelectorDW', 'ColourScaleCreator', 'ColourScaleCreatorDW']
 
 _TEXT_COLOUR_THRESHOLD = 100
+_TEXT_SUM_THRESHOLD = 3 * _TEXT_COLOUR_THRESHOLD  # Compared to channel sums
 _ICON_FILE_PATH = ''
 _EXTENDED_DEFAULT = False
-Colours: _Colours | None = None
+# Standard icons of the styles, by the address of the (C++) style object
+_STANDARD_ICONS: dict[int, dict[QStyle.StandardPixmap, QIcon]] = {}
+_COLOUR_BOXES: dict[tuple[int, int, int, int, int], QIcon] = {}
 
 
 def text_colour_threshold() -> int:
@@ -52,8 +68,32 @@ def set_text_colour_threshold(new_value: int) -> None:
     :param new_value: The new 8-bit threshold to set.
     """
 
-    global _TEXT_COLOUR_THRESHOLD
+    global _TEXT_COLOUR_THRESHOLD, _TEXT_SUM_THRESHOLD
     _TEXT_COLOUR_THRESHOLD = new_value
+    _TEXT_SUM_THRESHOLD = 3 * new_value
+
+
+def _standard_icon(widget: QWidget, sp: QStyle.StandardPixmap) -> QIcon:
+    """ Returns a standard icon of the widget's style, fetching it from the
+    style only on the first request. The icons are cached per style object
+    (styles sharing a name, e.g. style sheet ones, can differ) and dropped
+    when the style is destroyed.
+
+    :param widget: The widget whose style provides the icon.
+    :param sp: The standard pixmap to return as an icon.
+    """
+
+    style = widget.style()
+    key = getCppPointer(style)[0]  # The Python wrappers may be short-lived
+    if (icons := _STANDARD_ICONS.get(key)) is None:
+        icons = _STANDARD_ICONS[key] = {}
+        # A later style may be allocated at the same address
+        style.destroyed.connect(lambda: _STANDARD_ICONS.pop(key, None))
+
+    if (icon := icons.get(sp)) is None:
+        icon = icons[sp] = style.standardIcon(sp)
+
+    return icon
 
 
 def icon_file_path() -> str:
@@ -73,6 +113,34 @@ def set_icon_file_path(new_path: str = '') -> None:
     _ICON_FILE_PATH = new_path
 
 
+@cache
+def _window_icon(path: str) -> QIcon:
+    """ Returns the icon loaded from the given file, decoding each file
+    only once.
+
+    :param path: The path of the icon file.
+    """
+
+    return QIcon(path)
+
+
+def __getattr__(name: str) -> Any:
+    """ Creates the 'Colours' collection on its first access, so importing
+    the module does not build the palette.
+
+    :param name: The name of the requested module attribute.
+
+    :raises AttributeError: The module has no attribute with the given name.
+    """
+
+    if name == 'Colours':
+        global Colours  # Later accesses find it without this function
+        Colours = _Colours()
+        return Colours
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 def extended_default() -> bool:
     """ Returns the flag controlling the default tab of the colour selector. """
 
@@ -89,6 +157,16 @@ def set_extended_default(new_default: bool) -> None:
     _EXTENDED_DEFAULT = new_default
 
 
+@cache
+def _colour_list() -> list[dict[str, Any]]:
+    """ Returns the parsed content of the colour list file (parsed once). """
+
+    with open('colour_list.json', 'rb') as f:
+        data = f.read()
+
+    return orjson.loads(data) if _USE_ORJSON else json.loads(data)
+
+
 class Colour:
     """ A class to represent an RGB colour.
 
@@ -96,12 +174,14 @@ class Colour:
     :cvar r: The red value of the colour (read-only).
     :cvar g: The green value of the colour (read-only).
     :cvar b: The blue value of the colour (read-only).
+    :cvar as_rgb: The string representation of the colour as [R, G, B]
+        (read-only).
+    :cvar as_hex: The hexadecimal representation of the colour as '#RRGGBB'
+        (read-only).
     """
 
-    name: ReadOnlyDescriptor = ReadOnlyDescriptor()
-    r: ReadOnlyDescriptor = ReadOnlyDescriptor()
-    g: ReadOnlyDescriptor = ReadOnlyDescriptor()
-    b: ReadOnlyDescriptor = ReadOnlyDescriptor()
+    __slots__ = ('name', 'r', 'g', 'b', 'as_rgb', 'as_hex', '_rgb',
+                 '_channel_sum', '_hash', '_qcolor')
 
     def __init__(self, name: str = 'white', r: int = 255, g: int = 255,
                  b: int = 255) -> None:
@@ -113,10 +193,50 @@ class Colour:
         :param b: The 8-bit blue value of the colour. The default value is 255.
         """
 
-        self._name = name
-        self._r = r
-        self._g = g
-        self._b = b
+        # The read-only slots can only be set by bypassing __setattr__
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'r', r)
+        object.__setattr__(self, 'g', g)
+        object.__setattr__(self, 'b', b)
+        object.__setattr__(self, 'as_rgb', f"[{r:03}, {g:03}, {b:03}]")
+        object.__setattr__(self, 'as_hex', f'#{r:02X}{g:02X}{b:02X}')
+        object.__setattr__(self, '_rgb', (r, g, b))  # For comparisons
+        object.__setattr__(self, '_channel_sum', r + g + b)  # For text_colour
+        object.__setattr__(self, '_hash', hash((name, r, g, b)))
+        object.__setattr__(self, '_qcolor', QColor(r, g, b))
+
+    def __setattr__(self, name: str, value: Any) -> Never:
+        """ Sets the value of an attribute (would, but read-only).
+
+        :param name: The name of the attribute to set.
+        :param value: The value to set for the attribute.
+
+        :raises AttributeError: Notifies the user about the attribute being
+            read-only.
+        """
+
+        raise AttributeError(f"attribute '{name}' of "
+                             f"'{self.__class__.__name__}' object "
+                             f"is read-only")
+
+    def __delattr__(self, name: str) -> Never:
+        """ Deletes an attribute (would, but read-only).
+
+        :param name: The name of the attribute to delete.
+
+        :raises AttributeError: Notifies the user about the attribute being
+            read-only.
+        """
+
+        raise AttributeError(f"attribute '{name}' of "
+                             f"'{self.__class__.__name__}' object "
+                             f"is read-only")
+
+    def __reduce__(self) -> tuple[type, tuple[str, int, int, int]]:
+        """ Supports copying and pickling by recreating the object through
+        the initializer (the read-only slots cannot be set afterwards). """
+
+        return self.__class__, (self.name, self.r, self.g, self.b)
 
     def __repr__(self) -> str:
         """ Returns the repr of the object. """
@@ -131,41 +251,24 @@ class Colour:
         """
 
         if isinstance(other, Colour):
-            other_colour = (other.r, other.g, other.b)
-        elif isinstance(other, Iterable):
-            other_colour = other[:3]
+            return self._rgb == other._rgb
+        elif isinstance(other, Iterable):  # Not only sliceable ones
+            return self._rgb == tuple(islice(other, 3))
         elif isinstance(other, QColor):
-            other_colour = (other.red(), other.green(), other.blue())
-        else:
-            return id(self) == id(other)
+            return self._rgb == (other.red(), other.green(), other.blue())
 
-        return all(ch_a == ch_b for (ch_a, ch_b)
-                   in zip((self.r, self.g, self.b), other_colour))
+        return NotImplemented  # Lets Python try the reflected comparison
 
     def __iter__(self) -> Iterator[int]:
         """ Makes the object iterable. """
 
-        for ch in (self.r, self.g, self.b):
-            yield ch
+        return iter(self._rgb)
 
     def __hash__(self) -> int:
         """ Returns a hash created from the name and RGB values
         of the instance. """
 
-        return hash((self.name, self.r, self.g, self.b))
-
-    @cached_property
-    def as_rgb(self) -> str:
-        """ Returns a string representation of the colour as [R, G, B]. """
-
-        return f"[{self.r:03}, {self.g:03}, {self.b:03}]"
-
-    @cached_property
-    def as_hex(self) -> str:
-        """ Returns the hexadecimal representation of the colour
-        as '#RRGGBB'. """
-
-        return f'#{self.r:02X}{self.g:02X}{self.b:02X}'
+        return self._hash  # Computed once, the fields are read-only
 
     def as_qt(self, negative: bool = False) -> QColor:
         """ Returns a QColor object with the same RGB values
@@ -180,7 +283,7 @@ class Colour:
         if negative:
             return QColor(255 - self.r, 255 - self.g, 255 - self.b)
 
-        return QColor(self.r, self.g, self.b)
+        return QColor(self._qcolor)  # A copy, the cached one stays internal
 
     def colour_box(self, width: int = 20, height: int = 20) -> QIcon:
         """ Returns a colour box as a QIcon with the requested size.
@@ -193,16 +296,21 @@ class Colour:
         :returns: A QIcon of a given size with the colour of the instance.
         """
 
-        pixmap = QPixmap(width, height)
-        pixmap.fill(self.as_qt())
+        # Shared among colours with the same channels (e.g. blue and blue1)
+        key = (self.r, self.g, self.b, width, height)
+        if (icon := _COLOUR_BOXES.get(key)) is None:
+            pixmap = QPixmap(width, height)  # Needs a QGuiApplication
+            pixmap.fill(self._qcolor)
+            icon = _COLOUR_BOXES[key] = QIcon(pixmap)
 
-        return QIcon(pixmap)
+        return icon
 
     def text_colour(self) -> Qt.GlobalColor:
         """ Returns the (black/white) QColor that's appropriate to write with
         on the background with the given colour. """
 
-        if sum(self) / 3 > _TEXT_COLOUR_THRESHOLD:
+        # Comparing the channel sum instead of the average avoids a division
+        if self._channel_sum > _TEXT_SUM_THRESHOLD:
             return Qt.GlobalColor.black
         else:
             return Qt.GlobalColor.white
@@ -214,15 +322,23 @@ class _Colours(metaclass=Singleton):
     def __init__(self) -> None:
         """ Initializer for the class. """
 
-        with open('colour_list.json', 'r') as f:
-            colours = json.load(f)
-
-            self._colours_int = BijectiveDict(int)
-            self._colours_str = BijectiveDict(str)
-            for idx, colour_data in enumerate(colours):
-                colour = Colour(colour_data['name'], *colour_data['rgb'])
-                self._colours_int[idx] = colour
-                self._colours_str[colour.name] = colour
+        self._colours_int = BijectiveDict(int)
+        self._colours_str = BijectiveDict(str)
+        self._by_index: list[Colour] = []  # Direct lookups by index...
+        indices: dict[str, int] = {}  # ... and by name
+        self._by_rgb: dict[tuple[int, int, int], Colour] = {}
+        for idx, colour_data in enumerate(_colour_list()):
+            # Interned names make the dictionary probes identity checks
+            colour = Colour(sys.intern(colour_data['name']),
+                            *colour_data['rgb'])
+            self._colours_int[idx] = colour
+            self._colours_str[colour.name] = colour
+            self._by_index.append(colour)
+            indices[colour.name] = idx
+            # The first of the colours sharing their channels is kept
+            self._by_rgb.setdefault(tuple(colour), colour)
+
+        self._indices = MappingProxyType(indices)
 
     def __getattr__(self, name: str) -> Any:
         """ Handles an attribute access request.
@@ -233,16 +349,15 @@ class _Colours(metaclass=Singleton):
             dictionaries.
         """
 
-        try:
-            return getattr(self._colours_str, name)  # dict attributes
-        except AttributeError:
-            return self._colours_str[name]  # Colour object
+        if (colour := self._colours_str.get(name)) is not None:
+            return colour  # Colour object
+
+        return getattr(self._colours_str, name)  # dict attributes
 
     def __iter__(self) -> Iterator[Colour]:
         """ Makes the object iterable. """
 
-        for colour in self._colours_int.values():
-            yield colour
+        return iter(self._by_index)
 
     def __getitem__(self, index: int | Colour | str) \
             -> int | Colour | tuple[Colour, int]:
@@ -258,8 +373,8 @@ class _Colours(metaclass=Singleton):
         if isinstance(index, int | Colour):
             return self._colours_int[index]
         else:  # str
-            colour = self._colours_str[index]  # Might need to be moved to a f()
-            return colour, self._colours_int[colour]  # (Colour, int)
+            idx = self._indices[index]
+            return self._by_index[idx], idx  # (Colour, int)
 
     def index(self, name: str) -> int:
         """ Returns the index of a given colour in the collection.
@@ -267,15 +382,20 @@ class _Colours(metaclass=Singleton):
         :param name: The name of the colour to look up.
         """
 
-        return self._colours_int[self._colours_str[name]]  # str->Colour->int
+        return self._indices[name]
 
     def colour_at(self, idx: int) -> Colour:
         """ Returns the colour at the given numeric index.
 
         :param idx: The numeric index to look up.
+
+        :raises KeyError: The index is out of range (negative ones included).
         """
 
-        return self._colours_int[idx]
+        if not 0 <= idx < len(self._by_index):
+            raise KeyError(idx)
+
+        return self._by_index[idx]
 
     def from_qt(self, qc: QColor) -> Colour:
         """ Returns an existing colour or an unnamed custom one.
@@ -283,16 +403,14 @@ class _Colours(metaclass=Singleton):
         :param qc: The Qt colour based on which the search is to be conducted.
         """
 
-        channels = [('r', 'red'), ('g', 'green'), ('b', 'blue')]
-        for colour in self._colours_int.values():
-            if all(getattr(colour, ch1) == getattr(qc, ch2)()
-                   for ch1, ch2 in channels):
-                return colour
+        rgb = (qc.red(), qc.green(), qc.blue())
+        if (colour := self._by_rgb.get(rgb)) is not None:
+            return colour
 
-        return Colour('unnamed', *[getattr(qc, ch)() for _, ch in channels])
+        return Colour('unnamed', *rgb)
 
 
-@dataclass
+@dataclass(slots=True)
 class _ColourBoxData:
     """ Data for an individual colour box in the drawer widget.
 
@@ -321,6 +439,12 @@ class _ColourBoxDrawer(QWidget):
 
     colourSelected = Signal(int)
 
+    # (row, column) steps of the navigation keys
+    _NAVIGATION = {Qt.Key.Key_Up: (-1, 0),
+                   Qt.Key.Key_Down: (1, 0),
+                   Qt.Key.Key_Left: (0, -1),
+                   Qt.Key.Key_Right: (0, 1)}
+
     def __init__(self, default_colour: Colour) -> None:
         """ Initializer for the class.
 
@@ -333,16 +457,29 @@ class _ColourBoxDrawer(QWidget):
         self.setFixedSize(500, 450)
 
         self._default_colour = default_colour
-        self._colours = Colours
+        self._colours = _Colours()
         self._selection = _ColourBoxData()
-        self._boxes = []
-        for idx, colour in enumerate(self._colours):
-            self._boxes.append(_ColourBoxData(idx // 25, idx % 25, colour))
-            if colour == self._default_colour:
+        self._boxes = list(self._colours)  # Colours of the boxes, row-major
+        try:
+            idx = self._colours.index(self._default_colour.name)
+        except KeyError:  # Not a colour of the palette (e.g. 'unnamed')
+            pass
+        else:
+            if (colour := self._boxes[idx]) == self._default_colour:
                 self._selection.row = idx // 25
                 self._selection.column = idx % 25
                 self._selection.colour = colour
 
+        # The grid is static, so it is only rendered once
+        self._palette = QPixmap(self.size())
+        self._palette.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._palette)
+        for idx, colour in enumerate(self._boxes):
+            painter.fillRect(idx % 25 * 20, idx // 25 * 20,
+                             20, 20, colour.as_qt())
+
+        painter.end()
+
         self.update()
 
     @property
@@ -369,17 +506,20 @@ class _ColourBoxDrawer(QWidget):
         :param event: The mouse event that triggered the method.
         """
 
-        if event.button() == Qt.MouseButton.LeftButton:
-            self._selection.row = int(event.position().y()) // 20
-            self._selection.column = int(event.position().x()) // 20
-            index = self._selection.row * 25 + self._selection.column
-            try:
-                self._selection.colour = self._boxes[index].colour
-            except IndexError:
-                pass
-            else:
-                self.update()
-                self.colourSelected.emit(index)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+
+        row = int(event.position().y()) // 20
+        column = int(event.position().x()) // 20
+        index = row * 25 + column
+        if index >= len(self._boxes):  # An empty cell after the last colour
+            return
+
+        self._selection.row = row
+        self._selection.column = column
+        self._selection.colour = self._boxes[index]
+        self.update()
+        self.colourSelected.emit(index)
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """ Handles colour selection graphically and by emitting a signal.
@@ -387,35 +527,21 @@ class _ColourBoxDrawer(QWidget):
         :param event: The mouse event that triggered the method.
         """
 
-        index_modifiers = {
-            Qt.Key.Key_Up: {'row': -1, 'column': 0},
-            Qt.Key.Key_Down: {'row': 1, 'column': 0},
-            Qt.Key.Key_Left: {'row': 0, 'column': -1},
-            Qt.Key.Key_Right: {'row': 0, 'column': 1}
-        }
-
-        if (key := event.key()) in index_modifiers.keys():
-            row_history = self._selection.row
-            col_history = self._selection.column
-
-            self._selection.row += index_modifiers[key]['row']
-            self._selection.column += index_modifiers[key]['column']
-            index = self._selection.row * 25 + self._selection.column
-
-            if not all(0 <= x < 25 for x in [self._selection.row,
-                                             self._selection.column]):
-                self._selection.row = row_history
-                self._selection.column = col_history
-                return
+        if (step := self._NAVIGATION.get(event.key())) is None:
+            return
 
-            try:
-                self._selection.colour = self._boxes[index].colour
-            except IndexError:
-                self._selection.row = row_history
-                self._selection.column = col_history
-            else:
-                self.update()
-                self.colourSelected.emit(index)
+        row = self._selection.row + step[0]
+        column = self._selection.column + step[1]
+        index = row * 25 + column
+        if not (0 <= row < 25 and 0 <= column < 25) \
+                or index >= len(self._boxes):
+            return
+
+        self._selection.row = row
+        self._selection.column = column
+        self._selection.colour = self._boxes[index]
+        self.update()
+        self.colourSelected.emit(index)
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """ Prints the colour boxes and the selection rectangle.
@@ -423,12 +549,9 @@ class _ColourBoxDrawer(QWidget):
         :param event: The paint event that triggered the method.
         """
 
+        # No antialiasing: everything is drawn on the pixel grid
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        for box in self._boxes:
-            painter.fillRect(box.column * 20, box.row * 20,
-                             20, 20, box.colour.as_qt())
+        painter.drawPixmap(0, 0, self._palette)
 
         if self._selection.row != -1:
             painter.setPen(self._selection.colour.text_colour())
@@ -437,6 +560,56 @@ class _ColourBoxDrawer(QWidget):
                              20, 20)
 
 
+class _ColourListModel(QAbstractListModel):
+    """ A list model of colours, building the icons of the colours only when
+    they are first requested by a view. """
+
+    def __init__(self, colours: list[Colour], parent: QObject = None) -> None:
+        """ Initializer for the class.
+
+        :param colours: The colours to list.
+        :param parent: The parent object of the model. The default is None.
+        """
+
+        super().__init__(parent)
+
+        self._colours = colours
+
+    def rowCount(self, parent: QModelIndex = None) -> int:
+        """ Returns the number of colours in the model.
+
+        :param parent: The parent index, only the root has rows. The default
+            is None, referring to the root.
+        """
+
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self._colours)
+
+    def data(self, index: QModelIndex,
+             role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """ Returns the name or the icon (colour box) of a colour.
+
+        :param index: The index of the requested colour.
+        :param role: The role of the requested data. The default is the
+            display role, referring to the name.
+
+        :returns: The name, the colour box or None for other roles.
+        """
+
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._colours[index.row()].name
+
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._colours[index.row()].colour_box()  # Cached by Colour
+
+        return None
+
+
 class _ColourSelectorMixin:
     """ Mixin class for the colour selector.
 
@@ -461,14 +634,16 @@ class _ColourSelectorMixin:
 
         self.setWindowTitle("Colour selector")
         if _ICON_FILE_PATH:
-            self.setWindowIcon(QIcon(_ICON_FILE_PATH))
+            self.setWindowIcon(_window_icon(_ICON_FILE_PATH))
 
         self.setFixedSize(540, 605)
 
         # Constants and variables
         self._button_id = button_id
         self._default_colour = default_colour
-        self._colours = Colours
+        self._colours = _Colours()
+        self._colour_names = [colour.name.lower() for colour in self._colours]
+        self._hidden_rows = [False] * len(self._colour_names)
         self._extended = _EXTENDED_DEFAULT
         self._widget_theme = widget_theme
 
@@ -487,17 +662,17 @@ class _ColourSelectorMixin:
         self._ledFilter = QLineEdit('', parent=None)
         self._btnFilter = QPushButton()
         self._btnFilter.setIcon(
-            self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
-        self._btnFilter.setGeometry(0, 0, 50, 22)
+            _standard_icon(self, QStyle.StandardPixmap.SP_BrowserReload))
 
         self._cmbColourList = QComboBox(parent=None)
-        for colour in self._colours:
-            self._cmbColourList.addItem(colour.colour_box(), colour.name)
+        self._cmbColourList.setModel(
+            _ColourListModel(list(self._colours), self._cmbColourList))
 
         self._cmbColourList.setCurrentIndex(
             self._colours.index(self._default_colour.name))
 
         self._cmbColourList.setStyleSheet("combobox-popup: 0")
+        self._cmbColourList.view().setFixedHeight(200)
         self._cmbColourList.setObjectName('combobox')
 
         # Extended selector
@@ -517,11 +692,11 @@ class _ColourSelectorMixin:
         self._tabSelectors = QTabWidget()
 
         self._btnApply = QPushButton('Apply')
-        self._btnApply.setIcon(self.style().standardIcon(
-            QStyle.StandardPixmap.SP_DialogApplyButton))
+        self._btnApply.setIcon(_standard_icon(
+            self, QStyle.StandardPixmap.SP_DialogApplyButton))
         self._btnCancel = QPushButton('Cancel')
-        self._btnCancel.setIcon(self.style().standardIcon(
-            QStyle.StandardPixmap.SP_DialogCancelButton))
+        self._btnCancel.setIcon(_standard_icon(
+            self, QStyle.StandardPixmap.SP_DialogCancelButton))
 
         # ===== Layouts =====
         # Simple selector
@@ -609,15 +784,23 @@ class _ColourSelectorMixin:
     def _slot_filter(self) -> None:
         """ Filters the colour list based on the text in line edit. """
 
+        pattern = self._ledFilter.text().lower()
+        set_row_hidden = self._cmbColourList.view().setRowHidden
+        hidden = self._hidden_rows
         new_index = -1
-        for idx, colour in enumerate(self._colours):
-            condition = self._ledFilter.text().lower() in colour.name
-            self._cmbColourList.view().setRowHidden(idx, not condition)
-            if condition and new_index == -1:
-                new_index = idx
+        for idx, name in enumerate(self._colour_names):
+            # Only the rows whose visibility changes are passed to the view
+            if pattern in name:
+                if new_index == -1:
+                    new_index = idx
+                if hidden[idx]:
+                    set_row_hidden(idx, False)
+                    hidden[idx] = False
+            elif not hidden[idx]:
+                set_row_hidden(idx, True)
+                hidden[idx] = True
 
         self._cmbColourList.setCurrentIndex(new_index)
-        self._cmbColourList.view().setFixedHeight(200)
 
     def _slot_update_selection(self, index: int) -> None:
         """ Updates the data of the currently selected colour.
@@ -627,6 +810,9 @@ class _ColourSelectorMixin:
         """
 
         if (sender := self.sender().objectName()) == 'combobox':
+            if index < 0:  # Nothing matched the filter, the selection stays
+                return
+
             with SignalBlocker(self._colourBoxDrawer) as obj:
                 obj.selection = _ColourBoxData(
                     row=index // 25,
@@ -637,12 +823,10 @@ class _ColourSelectorMixin:
             with SignalBlocker(self._cmbColourList) as obj:
                 obj.setCurrentIndex(index)
 
-        self._lblCurrentColour.setText(
-            f"Selection: {self._colourBoxDrawer.selection.name}")
-        self._lblCurrentColourRGB.setText(
-            f"RGB: {self._colourBoxDrawer.selection.as_rgb}")
-        self._lblCurrentColourHex.setText(
-            f"Hex: {self._colourBoxDrawer.selection.as_hex}")
+        selection = self._colourBoxDrawer.selection
+        self._lblCurrentColour.setText(f"Selection: {selection.name}")
+        self._lblCurrentColourRGB.setText(f"RGB: {selection.as_rgb}")
+        self._lblCurrentColourHex.setText(f"Hex: {selection.as_hex}")
 
     def _slot_apply(self) -> None:
         """ Emits the ID of the set colour to the caller,
@@ -729,6 +913,7 @@ class _ColourScale(QWidget):
 
         self._colours: list[Colour] = colours
         self.scale_colours: list[QColor] | None = None  # Calculated list
+        self._rects: list[QRect] = []  # Where the scale colours are drawn
         self._steps = steps
         self._horizontal = horizontal
         if self._horizontal:
@@ -738,6 +923,8 @@ class _ColourScale(QWidget):
             self.setFixedSize(20, 500)
             self._bottom_right = QPoint(20, 500)
 
+        self._calculate_scale()
+
     def update_scale(self, colours: list[Colour], steps: int) -> None:
         """ Sets new controls to update the scale.
 
@@ -747,8 +934,36 @@ class _ColourScale(QWidget):
 
         self._colours = colours
         self._steps = steps
+        self._calculate_scale()
         self.update()
 
+    def _calculate_scale(self) -> None:
+        """ Calculates the scale colours and their rectangles (when the
+        controls change, instead of at every repaint). """
+
+        self._rects = []
+        if self._colours is None or len(self._colours) == 0:
+            self.scale_colours = None
+            return
+
+        self.scale_colours = [self._colours[0].as_qt()]
+        for pair in pairwise(self._colours):
+            self.scale_colours.extend(
+                self._segment_calculator(pair, self._steps))
+
+        last_coordinate = 0
+        step_size = 500 / len(self.scale_colours)
+        for _ in self.scale_colours:
+            if self._horizontal:
+                start = QPoint(last_coordinate, 0)
+                end = QPoint(int(last_coordinate + step_size), 20)
+            else:
+                start = QPoint(0, last_coordinate)
+                end = QPoint(20, int(last_coordinate + step_size))
+
+            self._rects.append(QRect(start, end))
+            last_coordinate = last_coordinate + step_size
+
     @classmethod
     def _segment_calculator(cls, colours: tuple[Colour], steps: int) \
             -> list[QColor]:
@@ -762,31 +977,14 @@ class _ColourScale(QWidget):
             scale.
         """
 
-        def _to_8_bit(value: int) -> int:
-            """ Coerces a value to be between 0 and 255 and returns
-            it as an integer. """
-
-            return int(min(255, max(0, value)))
-
-        start: Colour = colours[0]
-        end: Colour = colours[1]
-
-        step_sizes = {'r': 0, 'g': 0, 'b': 0}
-        channel_wise = {'r': None, 'g': None, 'b': None}
-        for ch in step_sizes.keys():
-            step_sizes[ch] = (abs(getattr(end, ch) - getattr(start, ch)) /
-                              (steps - 1))
-            sign = 1 if getattr(end, ch) >= getattr(start, ch) else -1
-            if step_sizes[ch] != 0:
-                internal = [_to_8_bit(getattr(start, ch) +
-                                      i * sign * step_sizes[ch])
-                            for i in range(steps)]
-            else:
-                internal = [getattr(start, ch) for _ in range(steps)]
-
-            channel_wise[ch] = internal + [getattr(end, ch)]
+        channel_wise = []
+        for start, end in zip(*colours):  # Channel by channel
+            step_size = (end - start) / (steps - 1)
+            # Clamped to 8 bits and truncated to integers
+            channel_wise.append([int(min(255, max(0, start + i * step_size)))
+                                 for i in range(steps)] + [end])
 
-        return [QColor(r, g, b) for r, g, b in zip(*channel_wise.values())]
+        return [QColor(r, g, b) for r, g, b in zip(*channel_wise)]
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """ Draws the requested scale.
@@ -797,30 +995,15 @@ class _ColourScale(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        if self._colours is None or len(self._colours) == 0:
+        if not self._rects:
             rect = QRect(QPoint(0, 0), self._bottom_right)
             painter.fillRect(rect, Qt.GlobalColor.white)
             painter.setPen(Qt.GlobalColor.black)
             painter.drawRect(rect)
             return
 
-        self.scale_colours = [self._colours[0].as_qt()]
-        for pair in pairwise(self._colours):
-            self.scale_colours.extend(
-                self._segment_calculator(pair, self._steps))
-
-        last_coordinate = 0
-        step_size = 500 / len(self.scale_colours)
-        for colour in self.scale_colours:
-            if self._horizontal:
-                start = QPoint(last_coordinate, 0)
-                end = QPoint(int(last_coordinate + step_size), 20)
-            else:
-                start = QPoint(0, last_coordinate)
-                end = QPoint(20, int(last_coordinate + step_size))
-
-            painter.fillRect(QRect(start, end), colour)
-            last_coordinate = last_coordinate + step_size
+        for rect, colour in zip(self._rects, self.scale_colours):
+            painter.fillRect(rect, colour)
 
 
 class _ColourScaleCreatorMixin:
@@ -853,7 +1036,7 @@ class _ColourScaleCreatorMixin:
         self.setFixedSize(525, 560)
 
         self._scale_colours = colours
-        self._colours = Colours
+        self._colours = _Colours()
         self._horizontal = horizontal
         self._widget_theme = widget_theme
         self._parent = parent
@@ -886,11 +1069,11 @@ class _ColourScaleCreatorMixin:
         self._btnUpdate = QPushButton("Update scale")
 
         self._btnApply = QPushButton('Apply')
-        self._btnApply.setIcon(self.style().standardIcon(
-            QStyle.StandardPixmap.SP_DialogApplyButton))
+        self._btnApply.setIcon(_standard_icon(
+            self, QStyle.StandardPixmap.SP_DialogApplyButton))
         self._btnCancel = QPushButton('Cancel')
-        self._btnCancel.setIcon(self.style().standardIcon(
-            QStyle.StandardPixmap.SP_DialogCancelButton))
+        self._btnCancel.setIcon(_standard_icon(
+            self, QStyle.StandardPixmap.SP_DialogCancelButton))
 
         # Layouts
         self._vloScaleControls = QVBoxLayout()
@@ -1146,14 +1329,14 @@ def _init_module():
 
     if not os.path.exists('colours.pyi'):
         imports = "from dataclasses import dataclass\n" \
-                  "from functools import cached_property\n" \
-                  "from typing import ClassVar, Optional\n" \
-                  "from PySide6.QtCore import Signal, Qt\n" \
+                  "from typing import Any, ClassVar, Optional\n" \
+                  "from PySide6.QtCore import QAbstractListModel, " \
+                  "QModelIndex, QObject, Signal, Qt\n" \
                   "from PySide6.QtGui import QColor, QIcon, QKeyEvent, " \
                   "QMouseEvent, QPaintEvent\n" \
                   "from PySide6.QtWidgets import QDialog, QDockWidget, " \
                   "QMainWindow, QWidget\n" \
-                  "from utils._general import ReadOnlyDescriptor, Singleton\n" \
+                  "from utils._general import Singleton\n" \
                   "from utils.theme import ThemeParameters\n\n\n"
 
         functions = [text_colour_threshold, set_text_colour_threshold,
@@ -1168,6 +1351,7 @@ def _init_module():
                    _Colours: None,
                    _ColourBoxData: None,
                    _ColourBoxDrawer: ['colourSelected(int)'],
+                   _ColourListModel: None,
                    _ColourSelectorMixin: ['colourChanged(int, Colour)'],
                    ColourSelector: None,
                    ColourSelectorDW: None,
@@ -1178,11 +1362,11 @@ def _init_module():
                    _TestApplication: None}
         for cls, sigs in classes.items():
             if cls == _Colours:
-                with open('colour_list.json', 'r') as f:
-                    colours = json.load(f)
-
                 extra_cvs = '\n'.join([f"\t{colour['name']}: Colour = None"
-                                       for colour in colours])
+                                       for colour in _colour_list()])
+            elif cls == Colour:  # Slots are not represented by stub_repr()
+                extra_cvs = ("\tname: str\n\tr: int\n\tg: int\n\tb: int\n"
+                             "\tas_rgb: str\n\tas_hex: str")
             else:
                 extra_cvs = None
 
@@ -1196,9 +1380,6 @@ def _init_module():
             f.write("Colours: _Colours = None\n\n\n")
             f.write(''.join(reprs))
 
-    global Colours
-    Colours = _Colours()
-
 
 _init_module()
 
@@ -1,10 +1,9 @@
 from dataclasses import dataclass
-from functools import cached_property
-from typing import ClassVar, Optional
-from PySide6.QtCore import Signal, Qt
+from typing import Any, ClassVar, Optional
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Signal, Qt
 from PySide6.QtGui import QColor, QIcon, QKeyEvent, QMouseEvent, QPaintEvent
 from PySide6.QtWidgets import QDialog, QDockWidget, QMainWindow, QWidget
-from utils._general import ReadOnlyDescriptor, Singleton
+from utils._general import Singleton
 from utils.theme import ThemeParameters
 
 
@@ -20,17 +19,14 @@ def set_extended_default(new_default: bool) -> None: ...
 
 
 class Colour:
-	b: ReadOnlyDescriptor = ReadOnlyDescriptor()
-	g: ReadOnlyDescriptor = ReadOnlyDescriptor()
-	name: ReadOnlyDescriptor = ReadOnlyDescriptor()
-	r: ReadOnlyDescriptor = ReadOnlyDescriptor()
-
+	name: str
+	r: int
+	g: int
+	b: int
+	as_rgb: str
+	as_hex: str
 	def __init__(self, name: str = 'white', r: int = 255, g: int = 255, b: int = 255) -> None: ...
-	@cached_property
-	def as_hex(self) -> str: ...
 	def as_qt(self, negative: bool = False) -> QColor: ...
-	@cached_property
-	def as_rgb(self) -> str: ...
 	def colour_box(self, width: int = 20, height: int = 20) -> QIcon: ...
 	def text_colour(self) -> Qt.GlobalColor: ...
 
@@ -609,6 +605,12 @@ class _ColourBoxDrawer(QWidget):
 	def selection(self, new_selection: _ColourBoxData) -> None: ...
 
 
+class _ColourListModel(QAbstractListModel):
+	def __init__(self, colours: list[Colour], parent: QObject = None) -> None: ...
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any: ...
+	def rowCount(self, parent: QModelIndex = None) -> int: ...
+
+
 class _ColourSelectorMixin:
 	colourChanged : ClassVar[Signal] = ...  # colourChanged(int, Colour)
 
@@ -658,6 +660,7 @@ class ColourSelectorDW(_ColourSelectorMixin, QDockWidget):
 
 class _ColourScale(QWidget):
 	def __init__(self, colours: list[Colour] = None, steps: int = 0, horizontal: bool = False) -> None: ...
+	def _calculate_scale(self) -> None: ...
 	@classmethod
 	def _segment_calculator(cls, colours: tuple[Colour], steps: int) -> list[QColor]: ...
 	def paintEvent(self, event: QPaintEvent) -> None: ...
@@ -14,7 +14,7 @@ def message(parent: QWidget, mbd: _MessageBoxData, custom_text: str = None) -> Q
 
 @dataclass
 class _MessageBoxData:
-	def __init__(self, icon: QMessageBox.Icon = Icon.NoIcon, title: str = '', text: str = '', buttons: list[QMessageBox.StandardButton] = None, flags: list[Qt.WindowType] = None) -> None: ...
+	def __init__(self, icon: QMessageBox.Icon = QMessageBox.Icon.NoIcon, title: str = '', text: str = '', buttons: list[QMessageBox.StandardButton] = None, flags: list[Qt.WindowType] = None) -> None: ...
 	def as_dict(self) -> dict: ...
 	@classmethod
 	def from_dict(cls, src: dict) -> _MessageBoxData: ...